@@ -1,4 +1,4 @@
 from .parser import Parser
 from .datatypes import *
 from .sections import Section
-from .base import parse,write
\ No newline at end of file
+from .base import parse,write,write_to_string
\ No newline at end of file
@@ -20,4 +20,14 @@ def write(file_or_fileobj, osu: OsuFile, parser=Parser()):
         with open(file_or_fileobj, 'w', encoding='utf8') as f:
             return write(f, osu, parser)
     else:
-        return parser._write(file_or_fileobj, osu)
\ No newline at end of file
+        return parser._write(file_or_fileobj, osu)
+
+class _StringSink(list):
+    'File-like object that collects the strings written to it'
+    write = list.append
+
+def write_to_string(osu: OsuFile, parser=Parser()) -> str:
+    'Write an OsuFile to a string (output is collected and joined once, rather than written into a growing buffer)'
+    sink = _StringSink()
+    write(sink, osu, parser)
+    return ''.join(sink)
\ No newline at end of file
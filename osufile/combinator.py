@@ -26,10 +26,16 @@ def compose(*fns):
 # --- combinators ---
 def ptuple(parsers, optionals=[]):
     parse_types,write_types = unzipl(parsers)
+    # if every field uses the same parsing function (e.g. x:y points, hit object headers),
+    # map() can drive the conversion loop instead of pairing up each item with its type
+    uniform_parse = parse_types[0] if all(t == parse_types[0] for t in parse_types) else None
     def parse(data):
         if len(data) + len(optionals) < len(parse_types):
             raise TypeError(f"parser requires at least {len(parse_types) - len(optionals)} arguments but only {len(data)} were given")
-        parsed = list(typed(parse_types, data))
+        if uniform_parse is not None:
+            parsed = list(map(uniform_parse, data[:len(parse_types)]))
+        else:
+            parsed = list(typed(parse_types, data))
         if len(parsed) < len(parse_types):
             num_to_extend = len(parse_types) - len(parsed)
             assert num_to_extend > 0
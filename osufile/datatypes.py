@@ -1,11 +1,15 @@
 import collections
 from dataclasses import dataclass
 
+# timing points, hit objects and events are created once per line of a beatmap,
+# so they use __slots__ to avoid carrying a __dict__ per instance
+
 class OsuFile(collections.OrderedDict):
     header: str
 
 @dataclass 
 class TimingPoint:
+    __slots__ = ('time', 'tick', 'meter', 'sampleset', 'sampleindex', 'volume', 'uninherited', 'effects')
     time: int
     tick: float 
     meter: int
@@ -20,6 +24,7 @@ class TimingPoint:
 #-------------------------------
 @dataclass 
 class HitSample:
+    __slots__ = ('normal_set', 'addition_set', 'index', 'volume', 'filename')
     normal_set: int
     addition_set: int
     index: int
@@ -28,6 +33,7 @@ class HitSample:
 
 @dataclass
 class HitCircle:
+    __slots__ = ('x', 'y', 'time', 'type', 'sound', 'sample')
     x: int
     y: int
     time: int
@@ -37,6 +43,7 @@ class HitCircle:
 
 @dataclass
 class Hold:
+    __slots__ = ('x', 'y', 'time', 'type', 'sound', 'endtime', 'sample')
     x: int
     y: int
     time: int
@@ -47,6 +54,7 @@ class Hold:
 
 @dataclass
 class Spinner:
+    __slots__ = ('x', 'y', 'time', 'type', 'sound', 'endtime', 'sample')
     x: int
     y: int
     time: int
@@ -57,6 +65,7 @@ class Spinner:
 
 @dataclass
 class Slider:
+    __slots__ = ('x', 'y', 'time', 'type', 'sound', 'curvetype', 'curvepoints', 'slides', 'length', 'edgesounds', 'edgesets', 'sample')
     x: int
     y: int
     time: int
@@ -72,6 +81,7 @@ class Slider:
 
 @dataclass
 class RawHitObject:
+    __slots__ = ('x', 'y', 'time', 'type', 'sound', 'others')
     x: int
     y: int
     time: int
@@ -84,11 +94,13 @@ class RawHitObject:
 #-------------------------------
 @dataclass
 class EventUnknown:
+    __slots__ = ('type', 'params')
     type : str
     params : list
 
 @dataclass
 class EventBackground:
+    __slots__ = ('type', 'time', 'filename', 'xoffset', 'yoffset')
     type : str
     time : int
     filename: str
@@ -97,6 +109,7 @@ class EventBackground:
 
 @dataclass
 class EventVideo:
+    __slots__ = ('type', 'time', 'filename', 'xoffset', 'yoffset')
     type : str
     time : int
     filename: str
@@ -105,6 +118,7 @@ class EventVideo:
 
 @dataclass
 class EventBreak:
+    __slots__ = ('type', 'time', 'end')
     type : str
     time : int
     end : int
\ No newline at end of file
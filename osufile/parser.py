@@ -47,6 +47,11 @@ class Parser:
         from .base import write
         return write(obj, osu, parser=self)
 
+    def write_to_string(self, osu):
+        'Helper function to call osufile.write_to_string using this parser'
+        from .base import write_to_string
+        return write_to_string(osu, parser=self)
+
     def _parse(self, file: TextIO) -> OsuFile:
         """
         Parse a .osu file from a file object
@@ -4,6 +4,7 @@ from .utils import *
 from .datatypes import *
 import warnings
 import collections
+import sys
 from enum import Enum, auto
 
 class Section(ABC):
@@ -182,15 +183,23 @@ class HitObjects(Section):
         hitsample = ParserPair(self.parse_hitsample, self.write_hitsample)
 
         def slider_curve():
-            ptparse = plist_split('|', ptuple_split(":", [osu_int, osu_int]))
+            ptwrite = plist_split('|', ptuple_split(":", [osu_int, osu_int])).write
+            parse_int = osu_int.parse
+            def parse_point(pt):
+                # same behaviour as ptuple_split(":", [osu_int, osu_int]) without the combinator overhead,
+                # sliders can have a lot of curve points
+                coords = pt.split(':')      # extra coordinates are ignored
+                if len(coords) < 2:
+                    raise TypeError(f"parser requires at least 2 arguments but only {len(coords)} were given")
+                return (parse_int(coords[0]), parse_int(coords[1]))
             def parse(obj):
                 # split the first item P|308:266|266:254|...
                 t,_,pts = obj.partition('|')
-                pts = ptparse.parse(pts)
+                pts = [parse_point(pt) for pt in pts.split('|')]
                 return t,pts
             def write(obj):
                 t,pts = obj
-                pts = ptparse.write(pts)
+                pts = ptwrite(pts)
                 return t + '|' + pts
             return ParserPair(parse, write)
 
@@ -212,6 +221,22 @@ class HitObjects(Section):
         ], optionals=[None, [], [], self.default_hitsample()])
         self.HOLD_ENDTIME_TYPE = osu_int
 
+        # hit object type -> (constructor, params parser), built once instead of on every line
+        self.HITOBJECT_PARSERS = {
+            self.HITTYPE_CIRCLE:  (HitCircle, self.parse_hitcircle_params),
+            self.HITTYPE_SLIDER:  (Slider, self.parse_slider_params),
+            self.HITTYPE_SPINNER: (Spinner, self.parse_spinner_params),
+            self.HITTYPE_HOLD:    (Hold, self.parse_hold_params),
+            None:                 (RawHitObject, lambda raw_others: [raw_others])   # RawHitObject params = one argument, containing all parameters
+        }
+        self.HITOBJECT_WRITERS = [
+            (HitCircle, self.write_hitcircle_params),
+            (Spinner, self.write_spinner_params),
+            (Slider, self.write_slider_params),
+            (Hold, self.write_hold_params),
+            (RawHitObject, lambda id: id[0])
+        ]
+
     # --- helper functions ---
     def default_hitsample(self):
         return HitSample(normal_set=0, addition_set=0, index=0, volume=0, filename='')
@@ -251,13 +276,7 @@ class HitObjects(Section):
         # parse header, and parse params using type from header
         header = self.HITOBJECT_HEADER.parse(raw_header)
         whatobj = self.hitobject_whattype(header[3])
-        constructor, parser = {
-            self.HITTYPE_CIRCLE:  (HitCircle, self.parse_hitcircle_params),
-            self.HITTYPE_SLIDER:  (Slider, self.parse_slider_params),
-            self.HITTYPE_SPINNER: (Spinner, self.parse_spinner_params),
-            self.HITTYPE_HOLD:    (Hold, self.parse_hold_params),
-            None:                 (RawHitObject, lambda raw_others: [raw_others])   # RawHitObject params = one argument, containing all parameters
-        }[whatobj]
+        constructor, parser = self.HITOBJECT_PARSERS[whatobj]
         others = parser(raw_others)
         return constructor(*header, *others)
 
@@ -267,14 +286,7 @@ class HitObjects(Section):
         header, others = objdata[:self.HITOBJECT_HEADER_SIZE], objdata[self.HITOBJECT_HEADER_SIZE:]
 
         # serialize params
-        lookup_table = [
-            (HitCircle, self.write_hitcircle_params),
-            (Spinner, self.write_spinner_params),
-            (Slider, self.write_slider_params),
-            (Hold, self.write_hold_params),
-            (RawHitObject, lambda id: id[0])
-        ]
-        for (type, writer) in lookup_table:
+        for (type, writer) in self.HITOBJECT_WRITERS:
             if isinstance(obj, type):
                 raw_others = writer(others)
                 break
@@ -345,12 +357,19 @@ class HitObjects(Section):
 #----------------------------------
 #    Events
 #----------------------------------
+def _content_lines(lines):
+    'Strip lines, skipping blank lines and // comments (strip/blank filtering is done by map/filter in one pass)'
+    return (line for line in filter(None, map(str.strip, lines)) if not line.startswith('//'))
+
 class Events(Section):
     class Type(Enum):
         BACKGROUND = auto()
         VIDEO = auto()
         BREAK = auto()
 
+    # the known event type names, interned so that every parsed event of a kind shares one string object
+    TYPE_NAMES = {name: name for name in map(sys.intern, ['0', '1', 'Video', '2'])}
+
     def __init__(self, base):
         self.base = base
         osu_int = self.base.osu_int
@@ -369,20 +388,20 @@ class Events(Section):
             self.Type.BREAK:      (EventBreak, ptuple([osu_int, osu_int])),
             None:                 (EventUnknown, ParserPair(lambda raw_others: [raw_others], lambda id: id[0])),
         }
+        self.TYPE_LOOKUP = {
+            '0':     self.Type.BACKGROUND,
+            '1':     self.Type.VIDEO,
+            'Video': self.Type.VIDEO,
+            '2':     self.Type.BREAK,
+        }
 
     def whattype(self, objtype):
         '''
         Figure out what event this is
-        returns one of [, None],
+        returns one of [self.Type.BACKGROUND, self.Type.VIDEO, self.Type.BREAK, None],
         None if the object does not match any of these types
         '''
-        LOOKUP = {
-            '0':     self.Type.BACKGROUND,
-            '1':     self.Type.VIDEO,
-            'Video': self.Type.VIDEO,
-            '2':     self.Type.BREAK,
-        }
-        return LOOKUP.get(objtype, None)
+        return self.TYPE_LOOKUP.get(objtype, None)
     
     def parse_line(self, line):
         # split header/others
@@ -390,10 +409,11 @@ class Events(Section):
         raw_header,raw_others = tokens[:self.HEADER_SIZE], tokens[self.HEADER_SIZE:]
         header = self.HEADER.parse(raw_header)
         
-        eventtype = self.whattype(header[0])
+        typename = self.TYPE_NAMES.get(header[0], header[0])
+        eventtype = self.whattype(typename)
         constructor, pw = self.EVENT_LOOKUP[eventtype]
         others = pw.parse(raw_others)
-        return constructor(*header, *others)
+        return constructor(typename, *header[1:], *others)
 
     def write_line(self, obj):
         # split data object into header/params
@@ -416,10 +436,7 @@ class Events(Section):
 
     def parse(self, section, lines):
         def objs():
-            for line in lines:
-                line = line.strip()
-                if line == '': continue
-                if line.startswith('//'): continue
+            for line in _content_lines(lines):
                 try:
                     yield self.parse_line(line)
                 except Exception as ex:
@@ -46,12 +46,12 @@ class ColourInterpreter:
         '''
         # have to be careful to preserve attribute ordering
         def remove_keys(keys, maindict):
-            return OrderedDict((k,v) for k,v in colour_data.items() if k not in keys)
+            return OrderedDict((k,v) for k,v in maindict.items() if k not in keys)
         
         # partition off the combo colours
         ordering = self.combo_ordering(colour_data)
         combo_colours = [colour_data[k] for k in ordering]
-        others = remove_keys(ordering, colour_data)
+        others = remove_keys(set(ordering), colour_data)     # set for O(1) membership checks
         return combo_colours, others
 
     def join_combo(self, colours_and_others):
@@ -5,29 +5,68 @@ from pathlib import Path
 from inspect import cleandoc
 
 class SectionTest(unittest.TestCase):
-    def setUp(self, section_name, parser):
+    # subclasses set the name of the section under test and build the section in make_section
+    SECTION_NAME = None
+
+    @classmethod
+    def make_section(cls, base):
+        '''Create the section being tested, base is the osufile.Parser it should use'''
+        raise NotImplementedError
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # sections don't hold any per-parse state, so one is built per class and shared by its tests
+        cls.section_name = cls.SECTION_NAME
+        cls.parser = cls.make_section(osufile.Parser())
+
+    def setUp(self):
         super().setUp()
-        self.section_name = section_name
-        self.parser = parser
+        self._buf = StringIO()     # reused by write_string
 
     def parse_string(self, text):
         '''Run some section text through the parser and return the output'''
-        return self.parser.parse(self.section_name, text.split('\n'))
+        # sections only iterate over their lines once, hand them an iterator like Parser._parse does
+        return self.parser.parse(self.section_name, iter(text.split('\n')))
     
     def write_string(self, parsed_section):
         '''Pass data into writer and return output as a string'''
-        s = StringIO()
-        self.parser.write(s, self.section_name, parsed_section)
-        return s.getvalue()
+        self._buf.seek(0)
+        self._buf.truncate(0)
+        self.parser.write(self._buf, self.section_name, parsed_section)
+        return self._buf.getvalue()
 
     # Helper tests
     def _test_section(self, text, expected):
-        '''Assert that some section text parses to an expected output'''
-        self.assertEqual(self.parse_string(text), expected)
+        '''Assert that some section text parses to an expected output, returns the parsed output'''
+        parsed = self.parse_string(text)
+        self.assertEqual(parsed, expected)
+        return parsed
+    
+    def _test_sections_bulk(self, samples_and_expecteds):
+        '''
+        Assert that several pieces of section text parse to their expected outputs, parsing them all as one section
+        Only works for sections where each line parses independently, and none of the samples can fail to parse
+        '''
+        parsed = self.parse_string('\n'.join(sample for sample,_ in samples_and_expecteds))
+        expected_count = sum(len(expected) for _,expected in samples_and_expecteds)
+        if len(parsed) != expected_count:
+            # the output can't be sliced up by sample, parse each sample on its own so the failure names the sample
+            for sample,expected in samples_and_expecteds:
+                with self.subTest(sample=sample):
+                    self._test_section(sample, expected)
+            self.assertEqual(len(parsed), expected_count, 'samples parse differently when joined into one section')
+            return
+        start = 0
+        for sample,expected in samples_and_expecteds:
+            with self.subTest(sample=sample):
+                self.assertEqual(parsed[start:start+len(expected)], expected)
+            start += len(expected)
     
     def _test_section_fail(self, text):
         '''Assert that some section text fails to parse'''
-        with self.assertRaises(Exception):
+        # sections wrap any parsing error in a ValueError
+        with self.assertRaises(ValueError):
             self.parse_string(text)
     
     def _test_roundtrip(self, section_data):
@@ -27,10 +27,11 @@ from osufile.combinator import ParserPair
 #   large numbers: treated as 0
 
 class ColoursSectionTest(SectionTest):
-    def setUp(self):
-        base = osufile.Parser()
-        parser = osufile.sections.Colours(base)
-        super().setUp('Colours', parser)
+    SECTION_NAME = 'Colours'
+
+    @classmethod
+    def make_section(cls, base):
+        return osufile.sections.Colours(base)
     
     def test_empty_section(self):
         self._test_section('', {})
@@ -65,29 +66,29 @@ class ColoursSectionTest(SectionTest):
     def test_colour_whitespace(self):
         self._test_section('Combo1 : 224  ,  51  ,1   ', {'Combo1': (224,51,1)})
     
+    SAMPLE_ORDER = cleandoc('''
+    Combo6 : 0,255,0
+    Combo1 : 224,51,1
+    Combo3 : 185,102,74
+    ''') + '\n'    # cleandoc() strips whitespace, manually add a trailing newline
     def test_preserves_order(self):
         # To check for order it does a raw string comparison which isn't great... 
         # can't figure out how to get the order without either implementing a parser yourself
         # or by reading the ordering from the built dict which isn't trustworthy
         # because the parser can shuffle around the keys while building the dict
         # I can't think of a better way to check for this
-        sample = cleandoc('''
-        Combo6 : 0,255,0
-        Combo1 : 224,51,1
-        Combo3 : 185,102,74
-        ''')
-        sample += '\n'  # cleandoc() strips whitespace, manually add a trailing newline
+        sample = self.SAMPLE_ORDER
         osu = self.parse_string(sample)
         s = self.write_string(osu)
         self.assertEqual(sample, s)
     
+    SAMPLE_ROUNDTRIP = cleandoc('''
+    Combo6 : 0,255,0
+    Combo1 : 224, 51 ,1
+    Combo3 : 185,102,74
+    SliderTrackOverride: 0,1,2
+    SliderBorder: 5,4,3
+    ''')
     def test_roundtrip(self):
-        sample = cleandoc('''
-        Combo6 : 0,255,0
-        Combo1 : 224, 51 ,1
-        Combo3 : 185,102,74
-        SliderTrackOverride: 0,1,2
-        SliderBorder: 5,4,3
-        ''')
-        self._test_roundtrip(sample)
+        self._test_roundtrip(self.SAMPLE_ROUNDTRIP)
     
\ No newline at end of file
@@ -6,10 +6,15 @@ from inspect import cleandoc
 from .SectionTest import SectionTest
 
 class EventSectionTest(SectionTest):
-    def setUp(self):
-        base = osufile.Parser()
-        parser = osufile.sections.Events(base)
-        return super().setUp('Events', parser)
+    EXPECTED_BACKGROUND = [osufile.EventBackground(type='0', time=0, filename='12.jpg', xoffset=0, yoffset=0)]
+    EXPECTED_VIDEO = [osufile.EventVideo(type='1', time=0, filename='video.mp4', xoffset=0, yoffset=0)]
+    EXPECTED_BREAK = [osufile.EventBreak(type='2', time=0, end=1000)]
+
+    SECTION_NAME = 'Events'
+
+    @classmethod
+    def make_section(cls, base):
+        return osufile.sections.Events(base)
     
     def test_event(self):
         test_cases = {
@@ -19,21 +24,22 @@ class EventSectionTest(SectionTest):
             'blank line': '\n0,0,12.jpg,0,0\n\n',
             'whitespace line': '\t\n0,0,12.jpg,0,0\n       ',
         }
-        EXPECTED = [osufile.EventBackground(type='0', time=0, filename='12.jpg', xoffset=0, yoffset=0)]
+        EXPECTED = self.EXPECTED_BACKGROUND
 
         test_case_crash = {}    # todo: test failure cases
 
+        parse = self.parse_string
         for name,data in test_cases.items():
             with self.subTest(case=name):
-                self._test_section(data, EXPECTED)
+                self.assertEqual(parse(data), EXPECTED)
         
         for name,data in test_case_crash.items():
             with self.subTest(case=name):
                 self._test_section_fail(data)
     
     def test_unknown(self):
-        self._test_section('a', [osufile.EventUnknown(type='a', params=[])])
-        self._test_roundtrip('a')
+        parsed = self._test_section('a', [osufile.EventUnknown(type='a', params=[])])
+        self._test_roundtrip(parsed)
 
     def test_background(self):
         test_cases = {
@@ -43,11 +49,11 @@ class EventSectionTest(SectionTest):
             'missing yoffset': '0,0,12.jpg,0',
             'missing xoffset': '0,0,12.jpg',
         }
-        EXPECTED = [osufile.EventBackground(type='0', time=0, filename='12.jpg', xoffset=0, yoffset=0)]
+        EXPECTED = self.EXPECTED_BACKGROUND
         for name,data in test_cases.items():
             with self.subTest(case=name):
-                self._test_section(data, EXPECTED)
-                self._test_roundtrip(data)
+                parsed = self._test_section(data, EXPECTED)
+                self._test_roundtrip(parsed)
             
         # spaces should not be stripped
         test_cases_spaces = {
@@ -59,8 +65,8 @@ class EventSectionTest(SectionTest):
             with self.subTest(case=name):
                 data = f'0,0,{input},0,0'
                 EXPECTED2 = [osufile.EventBackground(type='0', time=0, filename=output, xoffset=0, yoffset=0)]
-                self._test_section(data, EXPECTED2)
-                self._test_roundtrip(data)
+                parsed = self._test_section(data, EXPECTED2)
+                self._test_roundtrip(parsed)
 
         test_case_crash = {
             'bad xoffset': '0,0,12.jpg,bad,0',
@@ -79,12 +85,12 @@ class EventSectionTest(SectionTest):
             'missing yoffset': '1,0,video.mp4,0',
             'missing xoffset': '1,0,video.mp4',
         }
-        EXPECTED = [osufile.EventVideo(type='1', time=0, filename='video.mp4', xoffset=0, yoffset=0)]
+        EXPECTED = self.EXPECTED_VIDEO
             
         for name,data in test_cases.items():
             with self.subTest(case=name):
-                self._test_section(data, EXPECTED)
-                self._test_roundtrip(data)
+                parsed = self._test_section(data, EXPECTED)
+                self._test_roundtrip(parsed)
                 
         with self.subTest(case='normal_video'):
             self._test_section('Video,0,video.mp4,0,0', [osufile.EventVideo(type='Video', time=0, filename='video.mp4', xoffset=0, yoffset=0)])
@@ -99,8 +105,8 @@ class EventSectionTest(SectionTest):
             with self.subTest(case=name):
                 data = f'1,0,{input},0,0'
                 EXPECTED2 = [osufile.EventVideo(type='1', time=0, filename=output, xoffset=0, yoffset=0)]
-                self._test_section(data, EXPECTED2)
-                self._test_roundtrip(data)   
+                parsed = self._test_section(data, EXPECTED2)
+                self._test_roundtrip(parsed)
         
         test_case_crash = {
             'bad xoffset': '1,0,video.mp4,bad,0',
@@ -116,11 +122,11 @@ class EventSectionTest(SectionTest):
             'normal': '2,0,1000',
             'extra arguments': '2,0,1000,extra_argument',
         }
-        EXPECTED = [osufile.EventBreak(type='2', time=0, end=1000)]
+        EXPECTED = self.EXPECTED_BREAK
         for name,data in test_cases.items():
             with self.subTest(case=name):
-                self._test_section(data, EXPECTED)
-                self._test_roundtrip(data)
+                parsed = self._test_section(data, EXPECTED)
+                self._test_roundtrip(parsed)
 
         test_case_crash = {
             'missing arguments': '2,0',
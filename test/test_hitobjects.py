@@ -5,29 +5,40 @@ from pathlib import Path
 from inspect import cleandoc
 from .SectionTest import SectionTest
 
+# expected hit objects are constructed with positional arguments, field order is:
+#   HitCircle(x, y, time, type, sound, sample)
+#   Hold/Spinner(x, y, time, type, sound, endtime, sample)
+#   Slider(x, y, time, type, sound, curvetype, curvepoints, slides, length, edgesounds, edgesets, sample)
+
+# the hit sample that hit objects get when none is given, shared by the expected outputs
+# (the tests never modify expected hit samples, so one instance can be reused)
+_DEFAULT_HITSAMPLE = osufile.HitSample(normal_set=0, addition_set=0, index=0, volume=0, filename='')
+
 class HitObjectsSectionTest(SectionTest):
-    def setUp(self):
-        base = osufile.Parser()
-        parser = osufile.sections.HitObjects(base)
-        super().setUp('HitObjects', parser)
+    SECTION_NAME = 'HitObjects'
+
+    @classmethod
+    def make_section(cls, base):
+        return osufile.sections.HitObjects(base)
 
+    SAMPLE_EMPTY_LINE = cleandoc('''
+        200,100,10000,1,0,0:0:0:0:
+        
+        300,100,15000,1,0,0:0:0:0:
+    ''')
     def test_empty_line(self):
-        self._test_section(cleandoc('''
-            200,100,10000,1,0,0:0:0:0:
-            
-            300,100,15000,1,0,0:0:0:0:
-        '''), [
-            osufile.HitCircle(x=200, y=100, time=10000, type=1, sound=0, sample=osufile.HitSample(normal_set=0, addition_set=0, index=0, volume=0, filename='')),
-            osufile.HitCircle(x=300, y=100, time=15000, type=1, sound=0, sample=osufile.HitSample(normal_set=0, addition_set=0, index=0, volume=0, filename=''))
+        self._test_section(self.SAMPLE_EMPTY_LINE, [
+            osufile.HitCircle(200, 100, 10000, 1, 0, _DEFAULT_HITSAMPLE),
+            osufile.HitCircle(300, 100, 15000, 1, 0, _DEFAULT_HITSAMPLE)
         ])
 
     def test_unknown_hitobject(self):
         # has type 0, should be written as a RawHitObject
         sample = '200,100,10000,0,0,not,a,hitobject'
-        self._test_section(sample, [
+        parsed = self._test_section(sample, [
             osufile.RawHitObject(x=200, y=100, time=10000, type=0, sound=0, others=['not', 'a', 'hitobject'])]
         )
-        self._test_roundtrip(sample)
+        self._test_roundtrip(parsed)
 
 #---------------------------------------------------------
 #   HitSample tests
@@ -49,7 +60,7 @@ class HitObjectsSectionTest(SectionTest):
     
     def test_hitsample_missing_arguments(self):
         sample = '1:2:3'
-        with self.assertRaises(Exception):
+        with self.assertRaises(TypeError):
             self._get_sample_parser().parse_hitsample(sample)
 
 #---------------------------------------------------------
@@ -58,17 +69,19 @@ class HitObjectsSectionTest(SectionTest):
     def test_hitobject_header_not_enough_arguments(self):
         self._test_section_fail('200,100,10000,1')
     
+    SAMPLE_HITOBJECT_HEADER_INVALID = cleandoc('''
+        sdfdfg
+        200,100,10000,1,0,0:0:0:0:
+    ''')
     def test_hitobject_header_invalid(self):
-        self._test_section_fail(cleandoc('''
-            sdfdfg
-            200,100,10000,1,0,0:0:0:0:
-        '''))
+        self._test_section_fail(self.SAMPLE_HITOBJECT_HEADER_INVALID)
     
+    SAMPLE_HITOBJECT_HEADER_BAD_INPUT = cleandoc('''
+        200,100,10000,1,0,0:0:0:0:
+        200,100,asdf,1,0,0:0:0:0:
+    ''')
     def test_hitobject_header_bad_input(self):
-        self._test_section_fail(cleandoc('''
-            200,100,10000,1,0,0:0:0:0:
-            200,100,asdf,1,0,0:0:0:0:
-        '''))
+        self._test_section_fail(self.SAMPLE_HITOBJECT_HEADER_BAD_INPUT)
     
 #---------------------------------------------------------
 #   HitCircle tests
@@ -76,32 +89,33 @@ class HitObjectsSectionTest(SectionTest):
     def test_hitcircle(self):
         self._test_section(
             '200,100,10000,1,0,0:0:0:0:',
-            [osufile.HitCircle(x=200, y=100, time=10000, type=1, sound=0, sample=osufile.HitSample(normal_set=0, addition_set=0, index=0, volume=0, filename=''))]
+            [osufile.HitCircle(200, 100, 10000, 1, 0, _DEFAULT_HITSAMPLE)]
         )
     
     def test_hitcircle_extra_arguments(self):
         self._test_section(
             '200,100,10000,1,0,0:0:0:0:,asdfasdf',
-            [osufile.HitCircle(x=200, y=100, time=10000, type=1, sound=0, sample=osufile.HitSample(normal_set=0, addition_set=0, index=0, volume=0, filename=''))]
+            [osufile.HitCircle(200, 100, 10000, 1, 0, _DEFAULT_HITSAMPLE)]
         )
 
     def test_hitcircle_missing_sample(self):
         self._test_section(
             '200,100,10000,1,0',
-            [osufile.HitCircle(x=200, y=100, time=10000, type=1, sound=0, sample=osufile.HitSample(normal_set=0, addition_set=0, index=0, volume=0, filename=''))]
+            [osufile.HitCircle(200, 100, 10000, 1, 0, _DEFAULT_HITSAMPLE)]
         )
 
     def test_hitcircle_empty_sample(self):
         self._test_section(
             '200,100,10000,1,0,',
-            [osufile.HitCircle(x=200, y=100, time=10000, type=1, sound=0, sample=osufile.HitSample(normal_set=0, addition_set=0, index=0, volume=0, filename=''))]
+            [osufile.HitCircle(200, 100, 10000, 1, 0, _DEFAULT_HITSAMPLE)]
         )
         
+    SAMPLE_HITCIRCLE_ROUNDTRIP = cleandoc('''
+        200,100,10000,1,0
+        200,100,20000,1,0,0:0:0:0:
+    ''')
     def test_hitcircle_roundtrip(self):
-        self._test_roundtrip(cleandoc('''
-            200,100,10000,1,0
-            200,100,20000,1,0,0:0:0:0:
-        '''))
+        self._test_roundtrip(self.SAMPLE_HITCIRCLE_ROUNDTRIP)
 
 #---------------------------------------------------------
 #   Hold note tests
@@ -109,7 +123,7 @@ class HitObjectsSectionTest(SectionTest):
     def test_holdnote(self):
         self._test_section(
             '200,100,10000,128,0,11000:1:2:3:4:',
-            [osufile.Hold(x=200, y=100, time=10000, type=128, sound=0, endtime=11000, sample=osufile.HitSample(normal_set=1, addition_set=2, index=3, volume=4, filename=''))]
+            [osufile.Hold(200, 100, 10000, 128, 0, 11000, osufile.HitSample(normal_set=1, addition_set=2, index=3, volume=4, filename=''))]
         )
     
     def test_holdnote_missing_sample(self):
@@ -121,13 +135,14 @@ class HitObjectsSectionTest(SectionTest):
     def test_holdnote_extra_arguments(self):
         self._test_section(
             '200,100,10000,128,0,11000:1:2:3:4::hi',
-            [osufile.Hold(x=200, y=100, time=10000, type=128, sound=0, endtime=11000, sample=osufile.HitSample(normal_set=1, addition_set=2, index=3, volume=4, filename=''))]
+            [osufile.Hold(200, 100, 10000, 128, 0, 11000, osufile.HitSample(normal_set=1, addition_set=2, index=3, volume=4, filename=''))]
         )
 
+    SAMPLE_HOLDNOTE_ROUNDTRIP = cleandoc('''
+        200,100,10000,128,0,11000:1:2:3:4:
+    ''')
     def test_holdnote_roundtrip(self):
-        self._test_roundtrip(cleandoc('''
-            200,100,10000,128,0,11000:1:2:3:4:
-        '''))
+        self._test_roundtrip(self.SAMPLE_HOLDNOTE_ROUNDTRIP)
 
 #---------------------------------------------------------
 #   Spinner tests
@@ -135,14 +150,19 @@ class HitObjectsSectionTest(SectionTest):
     def test_spinner(self):
         self._test_section(
             '256,192,5000,12,0,6000,0:0:0:0:',
-            [osufile.Spinner(x=256, y=192, time=5000, type=12, sound=0, endtime=6000, sample=osufile.HitSample(normal_set=0, addition_set=0, index=0, volume=0, filename=''))]
+            [osufile.Spinner(256, 192, 5000, 12, 0, 6000, _DEFAULT_HITSAMPLE)]
         )
     
     def test_spinner_missing_arguments(self):
-        self._test_section_fail('256,192,5000,12,0,6000')     # missing hit sample
-        self._test_section_fail('256,192,5000,12,0')          # missing endtime
-        self._test_section_fail('256,192,5000,12,0,')         # empty endtime
-        self._test_section_fail('256,192,5000,12,0,6000,')    # empty hit sample
+        test_cases = (
+            ('missing hit sample', '256,192,5000,12,0,6000'),
+            ('missing endtime',    '256,192,5000,12,0'),
+            ('empty endtime',      '256,192,5000,12,0,'),
+            ('empty hit sample',   '256,192,5000,12,0,6000,'),
+        )
+        for name,data in test_cases:
+            with self.subTest(case=name):
+                self._test_section_fail(data)
 
     def test_spinner_bad_arguments(self):
         self._test_section_fail('256,192,5000,12,asdf,0:0:0:0:')
@@ -150,26 +170,28 @@ class HitObjectsSectionTest(SectionTest):
     def test_spinner_extra_arguments(self):
         self._test_section(
             '256,192,5000,12,0,6000,0:0:0:0:,14',
-            [osufile.Spinner(x=256, y=192, time=5000, type=12, sound=0, endtime=6000, sample=osufile.HitSample(normal_set=0, addition_set=0, index=0, volume=0, filename=''))]
+            [osufile.Spinner(256, 192, 5000, 12, 0, 6000, _DEFAULT_HITSAMPLE)]
         )
     
+    SAMPLE_SPINNER_ROUNDTRIP = cleandoc('''
+        256,192,5000,12,0,6000,0:0:0:0:
+    ''')
     def test_spinner_roundtrip(self):
-        self._test_roundtrip(cleandoc('''
-            256,192,5000,12,0,6000,0:0:0:0:
-        ''')) 
+        self._test_roundtrip(self.SAMPLE_SPINNER_ROUNDTRIP) 
 
 #---------------------------------------------------------
 #   Slider tests
 #---------------------------------------------------------    
     def test_slider(self):
-        self._test_section(
+        sliders = [
             '442,316,10170,2,0,P|459:276|452:220,1,83.9999974365235,2|0,0:0|0:0,0:0:0:0:',
-            [osufile.Slider(x=442, y=316, time=10170, type=2, sound=0, curvetype='P', curvepoints=[(459, 276), (452, 220)], slides=1, length=83.9999974365235, edgesounds=[2, 0], edgesets=[(0, 0), (0, 0)], sample=osufile.HitSample(normal_set=0, addition_set=0, index=0, volume=0, filename=''))]
-        )
-        self._test_section(
             '56,7,11670,2,0,L|152:-2,1,83.9999974365235,0,0:0,0:0:0:0:',
-            [osufile.Slider(x=56, y=7, time=11670, type=2, sound=0, curvetype='L', curvepoints=[(152, -2)], slides=1, length=83.9999974365235, edgesounds=[0], edgesets=[(0, 0)], sample=osufile.HitSample(normal_set=0, addition_set=0, index=0, volume=0, filename=''))]
-        )
+        ]
+        EXPECTED = [
+            osufile.Slider(442, 316, 10170, 2, 0, 'P', [(459, 276), (452, 220)], 1, 83.9999974365235, [2, 0], [(0, 0), (0, 0)], _DEFAULT_HITSAMPLE),
+            osufile.Slider(56, 7, 11670, 2, 0, 'L', [(152, -2)], 1, 83.9999974365235, [0], [(0, 0)], _DEFAULT_HITSAMPLE),
+        ]
+        self._test_sections_bulk([(s, [e]) for s,e in zip(sliders, EXPECTED)])
 
     def test_slider_optional_arguments(self):
         sliders = [
@@ -180,7 +202,7 @@ class HitObjectsSectionTest(SectionTest):
             '56,7,11670,2,0,L|152:-2,1'
         ]
         EXPECTED = [
-            osufile.Slider(x=56, y=7, time=11670, type=2, sound=0, curvetype='L', curvepoints=[(152, -2)], slides=1, length=83.9999974365235, edgesounds=[0], edgesets=[(0, 0)], sample=osufile.HitSample(normal_set=0, addition_set=0, index=0, volume=0, filename=''))
+            osufile.Slider(56, 7, 11670, 2, 0, 'L', [(152, -2)], 1, 83.9999974365235, [0], [(0, 0)], _DEFAULT_HITSAMPLE)
         for i in range(len(sliders))]
 
         # the parser doesn't recalculate omitted lengths, it sets the lengths to 0,
@@ -188,9 +210,7 @@ class HitObjectsSectionTest(SectionTest):
         for i in range(4, len(EXPECTED)):
             EXPECTED[i].length = 0
 
-        for s,e in zip(sliders, EXPECTED):
-            self._test_section(s, [e])
-        # self.assertEqual(self.parse_hitobjects('\n'.join(sliders)), EXPECTED)
+        self._test_sections_bulk([(s, [e]) for s,e in zip(sliders, EXPECTED)])
 
     def test_slider_too_few_arguments(self):
         self._test_section_fail('56,7,11670,2,0,L|152:-2')
@@ -198,69 +218,76 @@ class HitObjectsSectionTest(SectionTest):
     def test_slider_too_many_arguments(self):
         self._test_section(
             '56,7,11670,2,0,L|152:-2,1,83.9999974365235,0,0:0,0:0:0:0:,hi',
-            [osufile.Slider(x=56, y=7, time=11670, type=2, sound=0, curvetype='L', curvepoints=[(152, -2)], slides=1, length=83.9999974365235, edgesounds=[0], edgesets=[(0, 0)], sample=osufile.HitSample(normal_set=0, addition_set=0, index=0, volume=0, filename=''))]
+            [osufile.Slider(56, 7, 11670, 2, 0, 'L', [(152, -2)], 1, 83.9999974365235, [0], [(0, 0)], _DEFAULT_HITSAMPLE)]
         )
     
     def test_slider_edgesounds(self):
-        expected = [osufile.Slider(x=343, y=300, time=12570, type=2, sound=0, curvetype='P', curvepoints=[(308, 266), (266, 254)], slides=1, length=83.9999974365235, edgesounds=[2, 0], edgesets=[(2, 2), (0, 0)], sample=osufile.HitSample(normal_set=0, addition_set=0, index=0, volume=0, filename=''))]
-        check = lambda x: self._test_section(x, expected)
-        
-        # extra pipes (ignored)
-        check('343,300,12570,2,0,P|308:266|266:254,1,83.9999974365235,2|0|5,2:2|0:0,0:0:0:0:')
-        # missing pipes (should be filled with 0)
-        check('343,300,12570,2,0,P|308:266|266:254,1,83.9999974365235,2,2:2|0:0,0:0:0:0:')
-        # invalid pipes (should be filled with 0)
-        check('343,300,12570,2,0,P|308:266|266:254,1,83.9999974365235,2|asdf,2:2|0:0,0:0:0:0:')
+        expected = [osufile.Slider(343, 300, 12570, 2, 0, 'P', [(308, 266), (266, 254)], 1, 83.9999974365235, [2, 0], [(2, 2), (0, 0)], _DEFAULT_HITSAMPLE)]
+        sliders = [
+            # extra pipes (ignored)
+            '343,300,12570,2,0,P|308:266|266:254,1,83.9999974365235,2|0|5,2:2|0:0,0:0:0:0:',
+            # missing pipes (should be filled with 0)
+            '343,300,12570,2,0,P|308:266|266:254,1,83.9999974365235,2,2:2|0:0,0:0:0:0:',
+            # invalid pipes (should be filled with 0)
+            '343,300,12570,2,0,P|308:266|266:254,1,83.9999974365235,2|asdf,2:2|0:0,0:0:0:0:',
+        ]
+        self._test_sections_bulk([(s, expected) for s in sliders])
     
     def test_slider_edgesets(self):
-        expected = [osufile.Slider(x=343, y=300, time=12570, type=2, sound=0, curvetype='P', curvepoints=[(308, 266), (266, 254)], slides=1, length=83.9999974365235, edgesounds=[2, 0], edgesets=[(2, 2), (0, 0)], sample=osufile.HitSample(normal_set=0, addition_set=0, index=0, volume=0, filename=''))]
-        check = lambda x: self._test_section(x, expected)
+        expected = [osufile.Slider(343, 300, 12570, 2, 0, 'P', [(308, 266), (266, 254)], 1, 83.9999974365235, [2, 0], [(2, 2), (0, 0)], _DEFAULT_HITSAMPLE)]
+        sliders = [
+            # extra pipes (ignored)
+            '343,300,12570,2,0,P|308:266|266:254,1,83.9999974365235,2|0,2:2|0:0|3:4,0:0:0:0:',
+            # missing pipes (should be filled with (0,0))
+            '343,300,12570,2,0,P|308:266|266:254,1,83.9999974365235,2|0,2:2,0:0:0:0:',
+            # extra colons (ignored)
+            '343,300,12570,2,0,P|308:266|266:254,1,83.9999974365235,2|0,2:2:4|0:0:1|3:4:0,0:0:0:0:',
+        ]
+        self._test_sections_bulk([(s, expected) for s in sliders])
 
-        # extra pipes (ignored)
-        check('343,300,12570,2,0,P|308:266|266:254,1,83.9999974365235,2|0,2:2|0:0|3:4,0:0:0:0:')
-        # missing pipes (should be filled with (0,0))
-        check('343,300,12570,2,0,P|308:266|266:254,1,83.9999974365235,2|0,2:2,0:0:0:0:')
+        # failures have to be checked one at a time, since an error stops the whole section from parsing
         # invalid arguments in pipes (error)
         self._test_section_fail('343,300,12570,2,0,P|308:266|266:254,1,83.9999974365235,2|0,2:2|ohno,0:0:0:0:')
-        # extra colons (ignored)
-        check('343,300,12570,2,0,P|308:266|266:254,1,83.9999974365235,2|0,2:2:4|0:0:1|3:4:0,0:0:0:0:')
         # missing colons (error)
         self._test_section_fail('343,300,12570,2,0,P|308:266|266:254,1,83.9999974365235,2|0,2|0,0:0:0:0:')
         # invalid arguments in colons (error)
         self._test_section_fail('343,300,12570,2,0,P|308:266|266:254,1,83.9999974365235,2|0,2:2|0:ohno,0:0:0:0:')
     
+    SAMPLE_SLIDER_ROUNDTRIP = cleandoc('''
+        442,316,10170,2,0,P|459:276|452:220,1,83.9999974365235,2|0,0:0|0:0,0:0:0:0:
+        56,7,11670,2,0,L|152:-2,1,83.9999974365235,0,0:0,0:0:0:0:
+        343,300,12570,2,0,P|308:266|266:254,1,83.9999974365235,2|0,2:2|0:0,0:0:0:0:
+    ''')
     def test_slider_roundtrip(self):
-        self._test_roundtrip(cleandoc('''
-            442,316,10170,2,0,P|459:276|452:220,1,83.9999974365235,2|0,0:0|0:0,0:0:0:0:
-            56,7,11670,2,0,L|152:-2,1,83.9999974365235,0,0:0,0:0:0:0:
-            343,300,12570,2,0,P|308:266|266:254,1,83.9999974365235,2|0,2:2|0:0,0:0:0:0:
-        '''))
+        self._test_roundtrip(self.SAMPLE_SLIDER_ROUNDTRIP)
 
 #---------------------------------------------------------
 #   Bit precedence
 #---------------------------------------------------------   
-    def test_hitobject_precedence(self):
-        CIRCLE    = 0b00000001
-        SLIDER    = 0b00000010
-        SPINNER   = 0b00001000
-        HOLD      = 0b10000000
+    CIRCLE    = 0b00000001
+    SLIDER    = 0b00000010
+    SPINNER   = 0b00001000
+    HOLD      = 0b10000000
 
-        test_cases = {
-            # the obvious cases
-            CIRCLE: CIRCLE,
-            SLIDER: SLIDER,
-            SPINNER: SPINNER,
-            HOLD: HOLD,
-            # mixups
-            CIRCLE|SLIDER: CIRCLE,
-            CIRCLE|SPINNER: CIRCLE,
-            CIRCLE|HOLD: CIRCLE,
-            SLIDER|SPINNER: SLIDER,
-            SLIDER|HOLD: SLIDER,
-            SPINNER|HOLD: SPINNER,
-            # none
-            0: None,
-        }
+    # (type bitmask, expected hit object type)
+    PRECEDENCE_CASES = (
+        # the obvious cases
+        (CIRCLE, CIRCLE),
+        (SLIDER, SLIDER),
+        (SPINNER, SPINNER),
+        (HOLD, HOLD),
+        # mixups
+        (CIRCLE|SLIDER, CIRCLE),
+        (CIRCLE|SPINNER, CIRCLE),
+        (CIRCLE|HOLD, CIRCLE),
+        (SLIDER|SPINNER, SLIDER),
+        (SLIDER|HOLD, SLIDER),
+        (SPINNER|HOLD, SPINNER),
+        # none
+        (0, None),
+    )
 
-        for (objtype, expected) in test_cases.items():
-            self.assertEqual(self.parser.hitobject_whattype(objtype), expected)
\ No newline at end of file
+    def test_hitobject_precedence(self):
+        for (objtype, expected) in self.PRECEDENCE_CASES:
+            with self.subTest(objtype=bin(objtype)):
+                self.assertEqual(self.parser.hitobject_whattype(objtype), expected)
\ No newline at end of file
@@ -8,7 +8,10 @@ from .SectionTest import SectionTest
 from osufile.combinator import ParserPair
 
 class MetadataSectionTest(SectionTest):
-    def setUp(self):
+    SECTION_NAME = 'MetadataTesting'
+
+    @classmethod
+    def make_section(cls, base):
         # create sample lookup table
         pint = ParserPair(int, str)
         pfloat = ParserPair(float, str)
@@ -20,10 +23,7 @@ class MetadataSectionTest(SectionTest):
             'StackLeniency': pfloat,
             'TimelineZoom': pfloat,
         }
-
-        base = osufile.Parser()
-        parser = osufile.sections.Metadata(base, table)
-        super().setUp('MetadataTesting', parser)
+        return osufile.sections.Metadata(base, table)
     
     def test_empty_section(self):
         self._test_section('', {})
@@ -39,28 +39,28 @@ class MetadataSectionTest(SectionTest):
     def test_multiple_definitions(self):
         self._test_section('AudioFilename: audio.mp3\nAudioFilename: audio2.mp3', {'AudioFilename': 'audio2.mp3'})
     
-    def test_ignore_non_tags(self):
-        sample = cleandoc('''
-        AudioFilename: audio.mp3
+    SAMPLE_NON_TAGS = cleandoc('''
+    AudioFilename: audio.mp3
 
-        badtag
-        o0o0o0o0o    
-        ''')
-        self._test_section(sample, {'AudioFilename': 'audio.mp3'})
+    badtag
+    o0o0o0o0o    
+    ''')
+    def test_ignore_non_tags(self):
+        self._test_section(self.SAMPLE_NON_TAGS, {'AudioFilename': 'audio.mp3'})
     
+    SAMPLE_ORDER = cleandoc('''
+    TimelineZoom:3.0
+    AudioFilename:audio.mp3
+    PreviewTime:195852
+    StackLeniency:0.5
+    ''') + '\n'    # cleandoc() strips whitespace, manually add a trailing newline
     def test_preserves_order(self):
         # To check for order it does a raw string comparison which isn't great... 
         # can't figure out how to get the order without either implementing a parser yourself
         # or by reading the ordering from the built dict which isn't trustworthy
         # because the parser can shuffle around the keys while building the dict
         # I can't think of a better way to check for this
-        sample = cleandoc('''
-        TimelineZoom:3.0
-        AudioFilename:audio.mp3
-        PreviewTime:195852
-        StackLeniency:0.5
-        ''')
-        sample += '\n'  # cleandoc() strips whitespace, manually add a trailing newline
+        sample = self.SAMPLE_ORDER
         osu = self.parse_string(sample)
         s = self.write_string(osu)
         self.assertEqual(sample, s)
@@ -69,14 +69,14 @@ class MetadataSectionTest(SectionTest):
         # PreviewTime is an int but gets passed something that can't be parsed, should throw
         self._test_section_fail('AudioFilename: audio.mp3\nPreviewTime: asdf')
     
+    SAMPLE_ROUNDTRIP = cleandoc('''
+    TimelineZoom: 3
+    AudioFilename:audio.mp3
+    PreviewTime:195852
+    StackLeniency:0.5
+    AudioFilename: audio.mp3
+    NewTag: hello
+    ''')
     def test_roundtrip(self):
-        sample = cleandoc('''
-        TimelineZoom: 3
-        AudioFilename:audio.mp3
-        PreviewTime:195852
-        StackLeniency:0.5
-        AudioFilename: audio.mp3
-        NewTag: hello
-        ''')
-        self._test_roundtrip(sample)
+        self._test_roundtrip(self.SAMPLE_ROUNDTRIP)
     
\ No newline at end of file
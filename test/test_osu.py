@@ -1,6 +1,5 @@
 import unittest 
 import osufile
-from io import StringIO
 from pathlib import Path
 from inspect import cleandoc
 
@@ -75,6 +74,11 @@ __CWD__ = Path(__file__).parent.absolute()
 
 
 class OsuFileTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._parser = osufile.Parser()     # shared by every parse/write in these tests
+
     def roundtrip(self, sample):
         '''Run a roundtrip test on an .osu file (parse string -> write string -> parse string again -> check that first and second parse are the same)'''
         if isinstance(sample, osufile.OsuFile):
@@ -82,19 +86,15 @@ class OsuFileTest(unittest.TestCase):
         elif isinstance(sample, str):
             expected_osu = self.parse_string(sample)
         else:
-            expected_osu = osufile.parse(sample)
+            expected_osu = self._parser.parse(sample)
         
-        output = StringIO()
-        osufile.write(output, expected_osu)
-        output.seek(0)
-        actual_osu = osufile.parse(output)
+        actual_osu = self.parse_string(self.write_string(expected_osu))
         self.assertEqual(expected_osu, actual_osu)
 
     def parse_string(self, s):
         '''Parse .osu file held as contents of string'''
-        return osufile.parse(StringIO(s))
+        # the parser only iterates over lines, so it can be handed the lines directly instead of a StringIO
+        return self._parser.parse(iter(s.splitlines(keepends=True)))
     
     def write_string(self, osu):
-        s = StringIO()
-        osufile.write(s, osu)
-        return s.getvalue()
\ No newline at end of file
+        return self._parser.write_to_string(osu)
\ No newline at end of file
@@ -3,51 +3,53 @@ import osufile
 from io import StringIO
 from pathlib import Path
 from inspect import cleandoc
+import tempfile
 
 __CWD__ = Path(__file__).parent.absolute()
 
 class OsufileTest(unittest.TestCase):
     SAMPLE_FILE = __CWD__ / 'files' / 'cYsmix feat. Emmy - Tear Rain (jonathanlfj) [Insane].osu'
-    SAMPLE_OUT = __CWD__ / 'out' / 'out.osu'
-
-    def test_parse(self):
-        as_path = self.SAMPLE_FILE
-        as_str = str(as_path)
-
-        with self.subTest('pathlib.Path'):
-            osu_path = osufile.parse(as_path)
-        with self.subTest('string filepath'):
-            osu_str = osufile.parse(as_str)
-        with self.subTest('file object'):
-            with open(as_path, 'r', encoding='utf8') as as_fileobj:
-                osu_fileobj = osufile.parse(as_fileobj)
-
-        # check that they all parsed the same way
-        self.assertEqual(osu_path, osu_str)
-        self.assertEqual(osu_str, osu_fileobj)
-    
-    def test_write(self):
-        def read_sample_file():
-            with open(self.SAMPLE_OUT, 'r', encoding='utf8') as f:
-                return f.read()
-        
-        # get some sample data to write out
-        osu = osufile.parse(self.SAMPLE_FILE)
-        
-        as_path = self.SAMPLE_OUT
-        as_str = str(as_path)
-
-        with self.subTest('pathlib.Path'):
-            osufile.write(as_path, osu)
-            osu_path = read_sample_file()
-        with self.subTest('string filepath'):
-            osufile.write(as_str, osu)
-            osu_str = read_sample_file()
-        with self.subTest('file object'):
-            as_fileobj = StringIO()
-            osufile.write(as_fileobj, osu)
-            osu_fileobj = as_fileobj.getvalue()
-        
-        # check that they all output the same way
-        self.assertEqual(osu_path, osu_str)
-        self.assertEqual(osu_str, osu_fileobj)
+
+    @classmethod
+    def setUpClass(cls):
+        # parse the sample file once, the tests compare against / write out this copy
+        super().setUpClass()
+        with open(cls.SAMPLE_FILE, 'r', encoding='utf8') as f:
+            cls._osu_reference = osufile.parse(f)
+        # and write it out in memory once, the file writes are checked against this
+        cls._text_reference = osufile.write_to_string(cls._osu_reference)
+
+    def make_sample_out(self):
+        '''Returns a path to write output to, inside a temporary directory owned by this test (so tests can run in parallel)'''
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        return Path(tmpdir.name) / 'out.osu'
+
+    def read_sample_out(self, sample_out):
+        with open(sample_out, 'r', encoding='utf8') as f:
+            return f.read()
+
+    def test_parse_path(self):
+        self.assertEqual(osufile.parse(self.SAMPLE_FILE), self._osu_reference)
+
+    def test_parse_string_filepath(self):
+        self.assertEqual(osufile.parse(str(self.SAMPLE_FILE)), self._osu_reference)
+
+    def test_parse_fileobj(self):
+        with open(self.SAMPLE_FILE, 'r', encoding='utf8') as as_fileobj:
+            self.assertEqual(osufile.parse(as_fileobj), self._osu_reference)
+
+    def test_write_path(self):
+        sample_out = self.make_sample_out()
+        osufile.write(sample_out, self._osu_reference)
+        self.assertEqual(self.read_sample_out(sample_out), self._text_reference)
+
+    def test_write_string_filepath(self):
+        sample_out = self.make_sample_out()
+        osufile.write(str(sample_out), self._osu_reference)
+        self.assertEqual(self.read_sample_out(sample_out), self._text_reference)
+
+    def test_write_fileobj(self):
+        as_fileobj = StringIO()
+        osufile.write(as_fileobj, self._osu_reference)
+        self.assertEqual(as_fileobj.getvalue(), self._text_reference)
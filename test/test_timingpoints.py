@@ -1,87 +1,88 @@
 import unittest 
 import osufile
-from io import StringIO
-from pathlib import Path
+import os
+import time
 from inspect import cleandoc
 from .SectionTest import SectionTest
 
 class TimingPointsSectionTest(SectionTest):
-    def setUp(self):
-        base = osufile.Parser()
-        parser = osufile.sections.TimingPoints(base)
-        super().setUp('TimingPoints', parser)
+    # timing points shared by the tests below (tests only compare against these, so sharing them is safe)
+    _TP_BASE = osufile.TimingPoint(time=0, tick=300.0, meter=4, sampleset=1, sampleindex=0, volume=100, uninherited=True, effects=0)
+    _TP_2000 = osufile.TimingPoint(time=2000, tick=-75.0, meter=4, sampleset=2, sampleindex=0, volume=50, uninherited=False, effects=0)
+    _TP_1000 = osufile.TimingPoint(time=1000, tick=-75.0, meter=4, sampleset=2, sampleindex=0, volume=50, uninherited=False, effects=0)
 
+    SECTION_NAME = 'TimingPoints'
+
+    @classmethod
+    def make_section(cls, base):
+        return osufile.sections.TimingPoints(base)
+
+    SAMPLE_NORMAL = '0,300,4,1,0,100,1,0\n1000,-75,4,2,0,50,0,0'
+    # bad timing points are ignored
+    SAMPLE_BAD_INPUT = cleandoc('''
+    kjkjkjkjkjkjk
+    0,300,4,1,0,100,1,0
+
+    500,1,34wwerw
+    90e00,e,5,t
+    a,s,d,f
+    ''')
+    SAMPLE_OPTIONAL_ARGUMENTS = cleandoc('''
+    0,300,4,1,0,100,1,0
+    0,300,4,1,0,100,1
+    0,300,4,1,0,100
+    0,300,4,1,0
+    0,300,4,1
+    ''')
+    SAMPLE_TOO_MANY_ARGUMENTS = cleandoc('''
+    0,300,4,1,0,100,1,0,50
+    0,300,4,1,0,100,1,0,50,asdf
+    ''')
+    # could sort them by time if they're out of order, but for now, don't bother sorting them
+    SAMPLE_OUT_OF_ORDER = cleandoc('''
+    0,300,4,1,0,100,1,0
+    2000,-75,4,2,0,50,0,0
+    1000,-75,4,2,0,50,0,0
+    ''')
     def test_timingpoint(self):
-        sample = '0,300,4,1,0,100,1,0\n1000,-75,4,2,0,50,0,0'
-        self._test_section(sample, [
-            osufile.TimingPoint(time=0, tick=300.0, meter=4, sampleset=1, sampleindex=0, volume=100, uninherited=True, effects=0), 
-            osufile.TimingPoint(time=1000, tick=-75.0, meter=4, sampleset=2, sampleindex=0, volume=50, uninherited=False, effects=0)
+        # every line parses on its own, so all the samples can go through the parser as one section
+        self._test_sections_bulk([
+            (self.SAMPLE_NORMAL, [self._TP_BASE, self._TP_1000]),
+            (self.SAMPLE_BAD_INPUT, [self._TP_BASE]),
+            (self.SAMPLE_OPTIONAL_ARGUMENTS, [self._TP_BASE] * 5),
+            (self.SAMPLE_TOO_MANY_ARGUMENTS, [self._TP_BASE] * 2),
+            (self.SAMPLE_OUT_OF_ORDER, [self._TP_BASE, self._TP_2000, self._TP_1000]),
         ])
 
     def test_timingpoint_empty(self):
         self._test_section('', [])
         self._test_section('\n\n', [])
 
-    def test_timingpoint_bad_input(self):
-        # bad timing points are ignored
-        sample = cleandoc('''
-        kjkjkjkjkjkjk
-        0,300,4,1,0,100,1,0
-
-        500,1,34wwerw
-        90e00,e,5,t
-        a,s,d,f
-        ''')
-        EXPECTED = [
-            osufile.TimingPoint(time=0, tick=300.0, meter=4, sampleset=1, sampleindex=0, volume=100, uninherited=True, effects=0)
-        ]
-        self._test_section(sample, EXPECTED)
-    
-    def test_timingpoint_optional_arguments(self):
-        sample = cleandoc('''
-        0,300,4,1,0,100,1,0
-        0,300,4,1,0,100,1
-        0,300,4,1,0,100
-        0,300,4,1,0
-        0,300,4,1
-        ''')
-        EXPECTED = [
-            osufile.TimingPoint(time=0, tick=300.0, meter=4, sampleset=1, sampleindex=0, volume=100, uninherited=True, effects=0)
-        ] * 5
-        self._test_section(sample, EXPECTED)
-    
     def test_timingpoint_too_few_arguments(self):
         self._test_section_fail('0,300,4')
     
-    def test_timingpoint_too_many_arguments(self):
-        sample = cleandoc('''
-        0,300,4,1,0,100,1,0,50
-        0,300,4,1,0,100,1,0,50,asdf
-        ''')
-        EXPECTED = [
-            osufile.TimingPoint(time=0, tick=300.0, meter=4, sampleset=1, sampleindex=0, volume=100, uninherited=True, effects=0)
-        ] * 2
-        self._test_section(sample, EXPECTED)
-        
-    def test_timingpoint_out_of_order(self):
-        # could sort them by time if they're out of order, but for now, don't bother sorting them
-        sample = cleandoc('''
-        0,300,4,1,0,100,1,0
-        2000,-75,4,2,0,50,0,0
-        1000,-75,4,2,0,50,0,0
-        ''')
-        EXPECTED = [
-            osufile.TimingPoint(time=0, tick=300.0, meter=4, sampleset=1, sampleindex=0, volume=100, uninherited=True, effects=0), 
-            osufile.TimingPoint(time=2000, tick=-75.0, meter=4, sampleset=2, sampleindex=0, volume=50, uninherited=False, effects=0),
-            osufile.TimingPoint(time=1000, tick=-75.0, meter=4, sampleset=2, sampleindex=0, volume=50, uninherited=False, effects=0)
-        ]
-        self._test_section(sample, EXPECTED)
-    
+    SAMPLE_ROUNDTRIP = cleandoc('''
+    0,300,4,1,0,100,1,0
+    2000,-75,4,2,0,50,0,0
+    1000,-75,4,2,0,50,0,0
+    ''')
     def test_timingpoint_roundtrip(self):
-        sample = cleandoc('''
-        0,300,4,1,0,100,1,0
-        2000,-75,4,2,0,50,0,0
-        1000,-75,4,2,0,50,0,0
-        ''')
-        self._test_roundtrip(sample)
-    
\ No newline at end of file
+        self._test_roundtrip(self.SAMPLE_ROUNDTRIP)
+
+    def _large_sample(self, count):
+        return '\n'.join(f'{i*100},300,4,1,0,100,1,0' for i in range(count))
+
+    def test_timingpoint_large(self):
+        parsed = self.parse_string(self._large_sample(10000))
+        self.assertEqual(len(parsed), 10000)
+        self.assertEqual(parsed[-1], osufile.TimingPoint(time=999900, tick=300.0, meter=4, sampleset=1, sampleindex=0, volume=100, uninherited=True, effects=0))
+
+    @unittest.skipUnless(os.getenv('BENCH'), 'set BENCH=1 to run benchmarks')
+    def test_timingpoint_large_benchmark(self):
+        sample = self._large_sample(100000)
+        start = time.perf_counter()
+        parsed = self.parse_string(sample)
+        elapsed = time.perf_counter() - start
+        self.assertEqual(len(parsed), 100000)
+        # generous threshold, this is only meant to catch large regressions
+        self.assertLess(elapsed, 5.0)
\ No newline at end of file
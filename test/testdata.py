@@ -1,16 +1,15 @@
 import osufile
+import functools
 from pathlib import Path
 
 __CWD__ = Path(__file__).parent.absolute()
+__FILES__ = __CWD__ / 'files'
 
-FILE_CACHE = {}
-
+@functools.lru_cache(maxsize=None)
 def get_osu(name):
     """
     Get an OsuFile object by name. (For now names are just filenames of test files.)
-    Objects are lazily generated and cached afterwards.
+    Objects are lazily generated and cached afterwards, so the same object is returned for every call (don't modify it).
     """
     # for now, name is the name of the file
-    if name not in FILE_CACHE:
-        FILE_CACHE[name] = osufile.parse(__CWD__ / 'files' / name)
-    return FILE_CACHE[name]
\ No newline at end of file
+    return osufile.parse(__FILES__ / name)
@@ -1,9 +1,5 @@
 import unittest 
 import osufile.util.misc as misc
-from io import StringIO
-from pathlib import Path
-from inspect import cleandoc
-from collections import OrderedDict
 from ..testdata import get_osu
 
 class DefaultFilenameUtilsTest(unittest.TestCase):